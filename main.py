@@ -1,34 +1,97 @@
 import math
-import flet as ft
+import time
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import flet as ft
 
 # ---- Core 1/4-mile formulas ----
+_K = 5.825      # ET constant
+_M = 234.0      # MPH constant
+_INV3 = 1.0 / 3.0
+_K3 = _K * _K * _K              # 197.646...
+_M3_INV = 1.0 / (_M * _M * _M)  # 1 / 12812904
+_ET_MPH_PRODUCT = _K * _M  # ET * MPH is always 5.825 * 234 (1363.05)
+
+# Both variants return the real (signed) cube root for negative inputs
+if hasattr(math, "cbrt"):  # Python 3.11+
+    _cbrt = math.cbrt
+else:
+    def _cbrt(x):
+        return math.copysign(abs(x) ** _INV3, x)
+
 
 def hp_from_et_weight(et, weight):
     """Estimate flywheel HP from 1/4-mile ET (sec) and vehicle weight (lbs)."""
-    return weight / ((et / 5.825) ** 3)
+    return weight * _K3 / (et * et * et)
 
 
 def et_from_hp_weight(hp, weight):
     """Estimate 1/4-mile ET (sec) from HP and weight."""
-    return 5.825 * ((weight / hp) ** (1 / 3))
+    return _K * _cbrt(weight / hp)
 
 
 def hp_from_mph_weight(mph, weight):
     """Estimate flywheel HP from 1/4-mile trap speed (mph) and weight."""
-    return weight * ((mph / 234) ** 3)
+    return weight * (mph * mph * mph) * _M3_INV
 
 
 def mph_from_hp_weight(hp, weight):
     """Estimate 1/4-mile MPH from HP and weight."""
-    return 234 * ((hp / weight) ** (1 / 3))
+    return _M * _cbrt(hp / weight)
+
+
+# ---- Vectorized 1/4-mile formulas (for sweeps / plots) ----
+# Array twins of the scalar formulas above; they accept NumPy arrays (or
+# anything np.asarray() understands) and broadcast et/mph/hp against weight.
+# NumPy is imported on first use so it stays off the module import path.
+
+def _numpy():
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError(
+            "The *_arr sweep helpers require NumPy (pip install numpy)."
+        ) from None
+    return numpy
+
+
+def hp_from_et_weight_arr(et, weight):
+    """Array HP from 1/4-mile ET (sec) and weight (lbs); inputs broadcast."""
+    np = _numpy()
+    et = np.asarray(et, dtype=float)
+    return np.multiply(weight, _K3) / (et * et * et)
+
+
+def et_from_hp_weight_arr(hp, weight):
+    """Array 1/4-mile ET (sec) from HP and weight (lbs); inputs broadcast."""
+    np = _numpy()
+    return _K * np.cbrt(np.divide(weight, hp))
+
+
+def hp_from_mph_weight_arr(mph, weight):
+    """Array HP from 1/4-mile trap speed (mph) and weight (lbs); inputs broadcast."""
+    np = _numpy()
+    mph = np.asarray(mph, dtype=float)
+    return np.multiply(weight, mph * mph * mph) * _M3_INV
+
+
+def mph_from_hp_weight_arr(hp, weight):
+    """Array 1/4-mile MPH from HP and weight (lbs); inputs broadcast."""
+    np = _numpy()
+    return _M * np.cbrt(np.divide(hp, weight))
+
+
+_HP_TO_KW = 0.7457
+_KW_TO_HP = 1.0 / _HP_TO_KW
 
 
 def hp_to_kw(hp):
-    return hp * 0.7457
+    return hp * _HP_TO_KW
 
 
 def kw_to_hp(kw):
-    return kw / 0.7457
+    return kw * _KW_TO_HP
 
 
 # ---- Torque converter slip calculation ----
@@ -77,9 +140,65 @@ def mph_1_4_from_1_8(mph_eighth):
     return mph_eighth / MPH_1_8_FROM_1_4_FACTOR
 
 
+# ---- Combined ET / MPH / HP computation ----
+
+def _compute(source, weight, primary):
+    """Compute HP, kW and 1/4- and 1/8-mile ET/MPH from a single known value.
+    source: which value is known, "ET", "MPH" or "HP"
+    weight: vehicle weight in lbs
+    primary: the known value (ET and MPH in the 1/4-mile domain)
+    """
+    # Core math in 1/4-mile domain
+    if source == "ET":
+        et_qtr = primary
+        hp = hp_from_et_weight(et_qtr, weight)
+        mph_qtr = _ET_MPH_PRODUCT / et_qtr
+    elif source == "MPH":
+        mph_qtr = primary
+        hp = hp_from_mph_weight(mph_qtr, weight)
+        et_qtr = _ET_MPH_PRODUCT / mph_qtr
+    else:
+        hp = primary
+        et_qtr = et_from_hp_weight(hp, weight)
+        mph_qtr = mph_from_hp_weight(hp, weight)
+
+    return {
+        "hp": hp,
+        "kw": hp_to_kw(hp),
+        "et_qtr": et_qtr,
+        "mph_qtr": mph_qtr,
+        # Derived 1/8-mile estimates
+        "et_1_8": et_1_8_from_1_4(et_qtr),
+        "mph_1_8": mph_1_8_from_1_4(mph_qtr),
+    }
+
+
+# ---- Result text ----
+
+# printf-style templates for the compute results
+_F1 = "%.1f"
+_F3 = "%.3f"
+
+_RESULT_TPL = (
+    "From %(src)s:\n"
+    "  %(summary)s\n\n"
+    "  1/4-mile: ET ≈ %(et4).3f s, MPH ≈ %(mph4).1f\n"
+    "  1/8-mile: ET ≈ %(et8).3f s, MPH ≈ %(mph8).1f\n"
+    "(1/8-mile values are approximate conversions from 1/4-mile.)"
+)
+_HP_ESTIMATE_TPL = "HP ≈ %.1f hp (%.1f kW)"
+_HP_CONVERSION_TPL = "%.1f hp = %.1f kW"
+
+
 # ---- Flet UI ----
 
-def main(page: ft.Page):
+# Clicks arriving closer together than this are treated as a double tap
+_DEBOUNCE_S = 0.05
+
+def main(page: "ft.Page"):
+    # Imported here so the formulas above can be used without pulling in Flet
+    import flet as ft
+
     page.title = "ET / MPH / HP Calculator (1/4 & 1/8 mile)"
     page.padding = 20
     page.vertical_alignment = ft.MainAxisAlignment.START
@@ -105,7 +224,7 @@ def main(page: ft.Page):
     def on_et_blur(_):
         if et_tf.value:
             try:
-                et_tf.value = f"{float(et_tf.value):.3f}"
+                et_tf.value = _F3 % float(et_tf.value)
             except ValueError:
                 pass
 
@@ -173,25 +292,86 @@ def main(page: ft.Page):
     result_text = ft.Text("", selectable=True, size=14)
     tc_result_text = ft.Text("", selectable=True, size=14)
 
+    # Single snack bar reused for every error; only its text and open flag change
+    error_text = ft.Text("")
+    page.snack_bar = ft.SnackBar(content=error_text)
+
     def show_error(msg: str):
-        page.snack_bar = ft.SnackBar(content=ft.Text(msg))
+        error_text.value = msg
         page.snack_bar.open = True
-        page.update()
+        page.update(page.snack_bar)
+
+    # Last successfully parsed (text, value) per field, keyed by id(field)
+    _parse_cache = {}
 
     def parse_float(field: ft.TextField, name: str):
-        if not field.value:
+        s = field.value
+        if not s:
             raise ValueError(f"{name} is required.")
+        cached = _parse_cache.get(id(field))
+        if cached is not None and cached[0] is s:
+            return cached[1]
         try:
-            return float(field.value)
+            v = float(s)
         except ValueError:
             raise ValueError(f"{name} must be a number.")
+        _parse_cache[id(field)] = (s, v)
+        return v
 
     def using_quarter_mile() -> bool:
         return distance_dd.value == "1/4 mile"
 
     # -------- Button handlers --------
 
+    # Inputs behind the result currently shown, and when the last click was taken
+    last_sig = [None]
+    last_click = [0.0]
+
+    def input_signature(source):
+        return (
+            source,
+            weight_tf.value, et_tf.value, mph_tf.value, hp_tf.value,
+            distance_dd.value,
+        )
+
+    def skip_click(source) -> bool:
+        """True for double taps and for clicks whose inputs are already computed."""
+        now = time.monotonic()
+        if now - last_click[0] < _DEBOUNCE_S:
+            return True
+        last_click[0] = now
+        return input_signature(source) == last_sig[0]
+
+    def write_results(res, source):
+        # Update primary fields (respecting selected distance)
+        if using_quarter_mile():
+            et_tf.value = _F3 % res["et_qtr"]
+            mph_tf.value = _F1 % res["mph_qtr"]
+        else:
+            et_tf.value = _F3 % res["et_1_8"]
+            mph_tf.value = _F1 % res["mph_1_8"]
+
+        changed = [et_tf, mph_tf, result_text]
+        if source == "HP":
+            summary_tpl = _HP_CONVERSION_TPL
+        else:
+            hp_tf.value = _F1 % res["hp"]
+            changed.append(hp_tf)
+            summary_tpl = _HP_ESTIMATE_TPL
+
+        result_text.value = _RESULT_TPL % {
+            "src": source,
+            "summary": summary_tpl % (res["hp"], res["kw"]),
+            "et4": res["et_qtr"], "mph4": res["mph_qtr"],
+            "et8": res["et_1_8"], "mph8": res["mph_1_8"],
+        }
+        # Only send the controls written above instead of diffing the whole page
+        page.update(*changed)
+        last_sig[0] = input_signature(source)
+
     def on_from_et_click(e):
+        if skip_click("ET"):
+            return
         try:
             weight = parse_float(weight_tf, "Weight")
             et_input = parse_float(et_tf, "ET")
@@ -202,38 +382,14 @@ def main(page: ft.Page):
             else:
                 et_qtr = et_1_4_from_1_8(et_input)
 
-            # Core math in 1/4-mile domain
-            hp = hp_from_et_weight(et_qtr, weight)
-            mph_qtr = mph_from_hp_weight(hp, weight)
-            kw = hp_to_kw(hp)
-
-            # Derived 1/8-mile estimates
-            et_1_8 = et_1_8_from_1_4(et_qtr)
-            mph_1_8 = mph_1_8_from_1_4(mph_qtr)
-
-            # Update primary fields (respecting selected distance)
-            if using_quarter_mile():
-                et_tf.value = f"{et_qtr:.3f}"
-                mph_tf.value = f"{mph_qtr:.1f}"
-            else:
-                et_tf.value = f"{et_1_8:.3f}"
-                mph_tf.value = f"{mph_1_8:.1f}"
-
-            hp_tf.value = f"{hp:.1f}"
-
-            result_text.value = (
-                "From ET:\n"
-                f"  HP ≈ {hp:.1f} hp ({kw:.1f} kW)\n\n"
-                f"  1/4-mile: ET ≈ {et_qtr:.3f} s, MPH ≈ {mph_qtr:.1f}\n"
-                f"  1/8-mile: ET ≈ {et_1_8:.3f} s, MPH ≈ {mph_1_8:.1f}\n"
-                "(1/8-mile values are approximate conversions from 1/4-mile.)"
-            )
-            page.update()
+            write_results(_compute("ET", weight, et_qtr), "ET")
 
         except ValueError as ex:
             show_error(str(ex))
 
     def on_from_mph_click(e):
+        if skip_click("MPH"):
+            return
         try:
             weight = parse_float(weight_tf, "Weight")
             mph_input = parse_float(mph_tf, "MPH")
@@ -244,67 +400,19 @@ def main(page: ft.Page):
             else:
                 mph_qtr = mph_1_4_from_1_8(mph_input)
 
-            # Core math in 1/4-mile domain
-            hp = hp_from_mph_weight(mph_qtr, weight)
-            et_qtr = et_from_hp_weight(hp, weight)
-            kw = hp_to_kw(hp)
-
-            # Derived 1/8-mile estimates
-            et_1_8 = et_1_8_from_1_4(et_qtr)
-            mph_1_8 = mph_1_8_from_1_4(mph_qtr)
-
-            # Update primary fields
-            if using_quarter_mile():
-                mph_tf.value = f"{mph_qtr:.1f}"
-                et_tf.value = f"{et_qtr:.3f}"
-            else:
-                mph_tf.value = f"{mph_1_8:.1f}"
-                et_tf.value = f"{et_1_8:.3f}"
-
-            hp_tf.value = f"{hp:.1f}"
-
-            result_text.value = (
-                "From MPH:\n"
-                f"  HP ≈ {hp:.1f} hp ({kw:.1f} kW)\n\n"
-                f"  1/4-mile: ET ≈ {et_qtr:.3f} s, MPH ≈ {mph_qtr:.1f}\n"
-                f"  1/8-mile: ET ≈ {et_1_8:.3f} s, MPH ≈ {mph_1_8:.1f}\n"
-                "(1/8-mile values are approximate conversions from 1/4-mile.)"
-            )
-            page.update()
+            write_results(_compute("MPH", weight, mph_qtr), "MPH")
 
         except ValueError as ex:
             show_error(str(ex))
 
     def on_from_hp_click(e):
+        if skip_click("HP"):
+            return
         try:
             weight = parse_float(weight_tf, "Weight")
             hp = parse_float(hp_tf, "HP")
 
-            # Core math in 1/4-mile domain
-            et_qtr = et_from_hp_weight(hp, weight)
-            mph_qtr = mph_from_hp_weight(hp, weight)
-            kw = hp_to_kw(hp)
-
-            # 1/8-mile estimates
-            et_1_8 = et_1_8_from_1_4(et_qtr)
-            mph_1_8 = mph_1_8_from_1_4(mph_qtr)
-
-            # Update fields based on selected distance
-            if using_quarter_mile():
-                et_tf.value = f"{et_qtr:.3f}"
-                mph_tf.value = f"{mph_qtr:.1f}"
-            else:
-                et_tf.value = f"{et_1_8:.3f}"
-                mph_tf.value = f"{mph_1_8:.1f}"
-
-            result_text.value = (
-                "From HP:\n"
-                f"  {hp:.1f} hp = {kw:.1f} kW\n\n"
-                f"  1/4-mile: ET ≈ {et_qtr:.3f} s, MPH ≈ {mph_qtr:.1f}\n"
-                f"  1/8-mile: ET ≈ {et_1_8:.3f} s, MPH ≈ {mph_1_8:.1f}\n"
-                "(1/8-mile values are approximate conversions from 1/4-mile.)"
-            )
-            page.update()
+            write_results(_compute("HP", weight, hp), "HP")
 
         except ValueError as ex:
             show_error(str(ex))
@@ -338,7 +446,7 @@ def main(page: ft.Page):
                 f"  Engine RPM: {engine_rpm:.0f}\n"
                 f"  Slip: {slip_rpm:.0f} RPM ({slip_percent:.1f}%)\n"
             )
-            page.update()
+            page.update(tc_result_text)
 
         except ValueError as ex:
             show_error(str(ex))
@@ -376,6 +484,12 @@ def main(page: ft.Page):
 
 
 if __name__ == "__main__":
-    # For browser UI, use: ft.app(target=main, view=ft.WEB_BROWSER)
-    # ft.app(target=main)
-    ft.app(target=main, view=ft.WEB_BROWSER, assets_dir="assets")
\ No newline at end of file
+    import sys
+    import flet as ft
+
+    # Native desktop window by default; pass --web to open in a browser instead
+    if "--web" in sys.argv[1:]:
+        view = ft.AppView.WEB_BROWSER
+    else:
+        view = ft.AppView.FLET_APP
+    ft.app(target=main, view=view, assets_dir="assets")